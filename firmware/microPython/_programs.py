@@ -0,0 +1,54 @@
+"""
+Pre-packed demo programs for serv.py
+
+GENERATED by tools/gen_programs.py - do not edit by hand.
+Each constant is a series of 5-byte [addr][data LE] packets from
+address 0, ready to send in one SPI transaction.
+"""
+
+HELLO = (
+    b'\x00\x37\x45\x45\x48'  # [  0] 0x48454537
+    b'\x01\x13\x05\xc5\xc4'  # [  1] 0xC4C50513
+    b'\x02\x97\x05\x00\x4f'  # [  2] 0x4F000597
+    b'\x03\x17\x06\x00\x20'  # [  3] 0x20000617
+    b'\x04\x23\x20\xa6\x00'  # [  4] 0x00A62023
+    b'\x05\x23\x22\xb6\x00'  # [  5] 0x00B62223
+    b'\x06\x6f\x00\x00\x00'  # [  6] 0x0000006F
+)  # 35 bytes, address-prefixed
+
+LOOP = (
+    b'\x00\x13\x05\x00\x00'  # [  0] 0x00000513
+    b'\x01\x93\x05\x00\x10'  # [  1] 0x10000593
+    b'\x02\x17\x06\x00\x20'  # [  2] 0x20000617
+    b'\x03\x23\x00\xa6\x00'  # [  3] 0x00A60023
+    b'\x04\x13\x05\x15\x00'  # [  4] 0x00150513
+    b'\x05\x13\x06\x16\x00'  # [  5] 0x00160613
+    b'\x06\xe3\x4c\xb5\xfe'  # [  6] 0xFEB54CE3
+    b'\x07\x6f\x00\x00\x00'  # [  7] 0x0000006F
+)  # 40 bytes, address-prefixed
+
+RESET = (
+    b'\x00\x13\x00\x00\x00'  # [  0] 0x00000013
+    b'\x01\x13\x00\x00\x00'  # [  1] 0x00000013
+    b'\x02\x13\x00\x00\x00'  # [  2] 0x00000013
+    b'\x03\x13\x00\x00\x00'  # [  3] 0x00000013
+    b'\x04\x13\x00\x00\x00'  # [  4] 0x00000013
+    b'\x05\x13\x00\x00\x00'  # [  5] 0x00000013
+    b'\x06\x13\x00\x00\x00'  # [  6] 0x00000013
+    b'\x07\x13\x00\x00\x00'  # [  7] 0x00000013
+    b'\x08\x13\x00\x00\x00'  # [  8] 0x00000013
+    b'\x09\x13\x00\x00\x00'  # [  9] 0x00000013
+    b'\x0a\x13\x00\x00\x00'  # [ 10] 0x00000013
+    b'\x0b\x13\x00\x00\x00'  # [ 11] 0x00000013
+    b'\x0c\x13\x00\x00\x00'  # [ 12] 0x00000013
+    b'\x0d\x13\x00\x00\x00'  # [ 13] 0x00000013
+    b'\x0e\x13\x00\x00\x00'  # [ 14] 0x00000013
+    b'\x0f\x13\x00\x00\x00'  # [ 15] 0x00000013
+)  # 80 bytes, address-prefixed
+
+SIMPLE = (
+    b'\x00\x13\x05\xa0\x0a'  # [  0] 0x0AA00513
+    b'\x01\x97\x05\x00\x20'  # [  1] 0x20000597
+    b'\x02\x23\x80\xa5\x00'  # [  2] 0x00A58023
+    b'\x03\x6f\x00\x00\x00'  # [  3] 0x0000006F
+)  # 20 bytes, address-prefixed
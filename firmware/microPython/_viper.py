@@ -0,0 +1,52 @@
+"""
+Viper-compiled packet builders for serv.py
+
+Only importable on MicroPython ports with the native emitter; serv.py
+falls back to struct when the import fails.
+"""
+
+import micropython
+
+
+@micropython.viper
+def fill(buf: ptr8, base: int, words, start: int, n: int):
+    """
+    Pack words[start:start+n] into buf as 5-byte [addr][data LE] packets
+
+    Args:
+        buf: Destination buffer (at least 5*n bytes)
+        base: Address of words[start]
+        words: Sequence of 32-bit data values
+        start: Index of the first word to pack
+        n: Number of words to pack
+    """
+    for j in range(n):
+        w = int(words[start + j])
+        k = j * 5
+        buf[k] = base + j
+        buf[k + 1] = w
+        buf[k + 2] = w >> 8
+        buf[k + 3] = w >> 16
+        buf[k + 4] = w >> 24
+
+
+@micropython.viper
+def copy(buf: ptr8, base: int, src: ptr8, start: int, n: int):
+    """
+    Copy little-endian words start..start+n-1 from src into buf as packets
+
+    Args:
+        buf: Destination buffer (at least 5*n bytes)
+        base: Address of word start
+        src: Buffer of raw little-endian 32-bit words
+        start: Index of the first word to copy
+        n: Number of words to copy
+    """
+    for j in range(n):
+        k = j * 5
+        s = (start + j) * 4
+        buf[k] = base + j
+        buf[k + 1] = src[s]
+        buf[k + 2] = src[s + 1]
+        buf[k + 3] = src[s + 2]
+        buf[k + 4] = src[s + 3]
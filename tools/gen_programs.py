@@ -0,0 +1,116 @@
+"""
+Generate firmware/microPython/_programs.py from the RISC-V sources in
+tools/programs/
+
+Each <name>.s is assembled with the RISC-V GNU toolchain, its .text is
+extracted as a flat binary and emitted as a ready-to-send bytes constant
+<NAME> of address-prefixed 5-byte packets (same framing as
+SERVTester.write_word), starting at address 0.
+
+Usage:
+    python tools/gen_programs.py [--prefix riscv32-elf-]
+
+Freeze the generated module into the MicroPython image (or copy it next
+to serv.py) so the demo programs cost no runtime packing.
+"""
+
+import argparse
+import os
+import struct
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC_DIR = os.path.join(ROOT, 'tools', 'programs')
+OUT_PATH = os.path.join(ROOT, 'firmware', 'microPython', '_programs.py')
+
+# Must match _PACKET_FMT in serv.py: [addr][data (32-bit little-endian)]
+PACKET_FMT = '<BI'
+
+
+def assemble(path, prefix):
+    """
+    Assemble a .s file and return its instruction words
+
+    Args:
+        path: Path to the assembly source
+        prefix: Toolchain prefix (e.g. 'riscv32-elf-')
+
+    Returns:
+        list: 32-bit instruction words in load order
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        obj = os.path.join(tmp, 'prog.o')
+        binary = os.path.join(tmp, 'prog.bin')
+
+        subprocess.run([prefix + 'as', '-march=rv32i', '-mabi=ilp32',
+                        '-o', obj, path], check=True)
+        subprocess.run([prefix + 'objcopy', '-O', 'binary', '-j', '.text',
+                        obj, binary], check=True)
+
+        with open(binary, 'rb') as f:
+            image = f.read()
+
+    if len(image) % 4:
+        raise ValueError(f"{path}: image is not a whole number of words")
+
+    return [w for (w,) in struct.iter_unpack('<I', image)]
+
+
+def render(programs):
+    """
+    Render the _programs.py module source
+
+    Args:
+        programs: List of (NAME, words) tuples
+
+    Returns:
+        str: Module source
+    """
+    lines = [
+        '"""',
+        'Pre-packed demo programs for serv.py',
+        '',
+        'GENERATED by tools/gen_programs.py - do not edit by hand.',
+        'Each constant is a series of 5-byte [addr][data LE] packets from',
+        'address 0, ready to send in one SPI transaction.',
+        '"""',
+    ]
+
+    for name, words in programs:
+        lines.append('')
+        lines.append(f'{name} = (')
+        for addr, word in enumerate(words):
+            packet = struct.pack(PACKET_FMT, addr, word)
+            literal = ''.join(f'\\x{b:02x}' for b in packet)
+            lines.append(f"    b'{literal}'  # [{addr:3d}] 0x{word:08X}")
+        lines.append(f')  # {5 * len(words)} bytes, address-prefixed')
+
+    return '\n'.join(lines) + '\n'
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--prefix', default=os.environ.get('RISCV_PREFIX', 'riscv32-elf-'),
+                        help="RISC-V toolchain prefix (default: riscv32-elf-)")
+    parser.add_argument('-o', '--output', default=OUT_PATH,
+                        help="Output module path")
+    args = parser.parse_args()
+
+    programs = []
+    for filename in sorted(os.listdir(SRC_DIR)):
+        if filename.endswith('.s'):
+            name = os.path.splitext(filename)[0].upper()
+            words = assemble(os.path.join(SRC_DIR, filename), args.prefix)
+            programs.append((name, words))
+            print(f"{name}: {len(words)} words", file=sys.stderr)
+
+    with open(args.output, 'w') as f:
+        f.write(render(programs))
+
+    print(f"Wrote {args.output}", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,11 @@
+# Program that writes 0xHELLO pattern (0x48454C4C 0x4F000000)
+# Kept as raw .word values so the image matches the original hand encoding
+
+    .text
+    .word 0x48454537    # lui x10, 0x48454     (load HELL)
+    .word 0xc4c50513    # addi x10, x10, -956  (adjust to 0x48454C4C)
+    .word 0x4f000597    # auipc x11, 0x4f000   (load O)
+    .word 0x20000617    # auipc x12, 0x200     (base address)
+    .word 0x00a62023    # sw x10, 0(x12)       (store HELL)
+    .word 0x00b62223    # sw x11, 4(x12)       (store O)
+    .word 0x0000006f    # jal x0, 0            (infinite loop)
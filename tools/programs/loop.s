@@ -0,0 +1,12 @@
+# Program: Count from 0 to 255, writing to consecutive addresses
+# Kept as raw .word values so the image matches the original hand encoding
+
+    .text
+    .word 0x00000513    # addi x10, x0, 0       (x10 = 0, counter)
+    .word 0x10000593    # addi x11, x0, 256     (x11 = 256, limit)
+    .word 0x20000617    # auipc x12, 0x200      (x12 = base address)
+    .word 0x00a60023    # sb x10, 0(x12)        (store counter)
+    .word 0x00150513    # addi x10, x10, 1      (counter++)
+    .word 0x00160613    # addi x12, x12, 1      (address++)
+    .word 0xfeb54ce3    # blt x10, x11, -8      (loop if counter < limit)
+    .word 0x0000006f    # jal x0, 0             (infinite loop)
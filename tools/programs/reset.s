@@ -0,0 +1,6 @@
+# NOPs for the first 16 locations, used by reset_cpu()
+
+    .text
+    .rept 16
+    nop                 # addi x0, x0, 0
+    .endr
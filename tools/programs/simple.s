@@ -0,0 +1,8 @@
+# Simple program: Write 0xAA to memory location 0x200
+# Kept as raw .word values so the image matches the original hand encoding
+
+    .text
+    .word 0x0AA00513    # addi x10, x0, 0xAA    (x10 = 0xAA)
+    .word 0x20000597    # auipc x11, 0x200      (x11 = pc + 0x200000)
+    .word 0x00a58023    # sb x10, 0(x11)        (store byte)
+    .word 0x0000006f    # jal x0, 0             (infinite loop)